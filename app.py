@@ -7,14 +7,19 @@ os.environ.setdefault('OAUTHLIB_INSECURE_TRANSPORT', '1')
 from flask import Flask, render_template, request, jsonify, session, redirect, url_for, make_response
 from flask_cors import CORS
 import json
+import hashlib
 import gc
+import logging
 import warnings
 from datetime import date, datetime, time as dt_time, timedelta, timezone
-from dotenv import load_dotenv
-from threading import Lock
+from threading import Lock, local
+from concurrent.futures import ThreadPoolExecutor
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file for local runs; hosted
+# platforms already provide the environment.
+if not (os.getenv('RENDER') or os.getenv('HEROKU')):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Keep OAuth scope upgrades from crashing token exchange.
 os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = '1'
@@ -23,14 +28,27 @@ warnings.filterwarnings('ignore', message='.*Scope has changed.*')
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import Flow
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from oauthlib.oauth2.rfc6749.errors import InvalidGrantError, OAuth2Error
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import re
+from itertools import groupby
+from functools import lru_cache
 from openai import OpenAI
 
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').strip().upper()
+if not isinstance(logging.getLevelName(LOG_LEVEL), int):
+    LOG_LEVEL = 'INFO'
+logging.basicConfig(
+    level=LOG_LEVEL,
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+log = logging.getLogger(__name__)
+
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-this')
 
@@ -56,7 +74,9 @@ SCOPES = [
 ]
 CALENDAR_WRITE_SCOPE = 'https://www.googleapis.com/auth/calendar'
 CALENDAR_READONLY_SCOPE = 'https://www.googleapis.com/auth/calendar.readonly'
+SESSION_CREDENTIAL_KEYS = ('token', 'refresh_token', 'scopes')
 CLIENT_CONFIG = json.loads(os.environ["CLIENT_CONFIG"])
+OAUTH_CLIENT_CONFIG: Dict[str, Any] = CLIENT_CONFIG.get('web') or CLIENT_CONFIG.get('installed') or {}
 
 # Environment variables
 SPREADSHEET_ID = os.environ.get('SPREADSHEET_ID', '')
@@ -74,7 +94,9 @@ MAX_SCHEDULE_ROWS = 180
 KEY_EVENT_LOOKBACK_DAYS = 7
 KEY_EVENT_LOOKAHEAD_DAYS = 365
 KEY_EVENT_LIMIT = 100
-KEY_EVENTS_SHEET_RANGE = 'A1:Z2000'
+# Whole-row ranges so member and event columns past Z are still visible.
+KEY_EVENTS_SHEET_RANGE = '1:2000'
+HEADER_ROW_RANGE = '1:1'
 try:
     SHEET_METADATA_CACHE_SECONDS = int(os.environ.get('SHEET_METADATA_CACHE_SECONDS', '300'))
 except ValueError:
@@ -85,11 +107,27 @@ try:
 except ValueError:
     SHEET_ROW_SCAN_LIMIT = 1500
 SHEET_ROW_SCAN_LIMIT = max(200, min(5000, SHEET_ROW_SCAN_LIMIT))
+try:
+    SHEET_READ_CACHE_SECONDS = int(os.environ.get('SHEET_READ_CACHE_SECONDS', '15'))
+except ValueError:
+    SHEET_READ_CACHE_SECONDS = 15
+SHEET_READ_CACHE_SECONDS = max(0, min(300, SHEET_READ_CACHE_SECONDS))
+SHEET_READ_CACHE_MAX_ENTRIES = 64
 try:
     REQUEST_GC_INTERVAL = int(os.environ.get('REQUEST_GC_INTERVAL', '60'))
 except ValueError:
     REQUEST_GC_INTERVAL = 60
 REQUEST_GC_INTERVAL = max(0, min(2000, REQUEST_GC_INTERVAL))
+try:
+    AVAILABILITY_PARSE_WORKERS = int(os.environ.get('AVAILABILITY_PARSE_WORKERS', '4'))
+except ValueError:
+    AVAILABILITY_PARSE_WORKERS = 4
+AVAILABILITY_PARSE_WORKERS = max(1, min(32, AVAILABILITY_PARSE_WORKERS))
+try:
+    GOOGLE_HTTP_TIMEOUT_SECONDS = int(os.environ.get('GOOGLE_HTTP_TIMEOUT_SECONDS', '20'))
+except ValueError:
+    GOOGLE_HTTP_TIMEOUT_SECONDS = 20
+GOOGLE_HTTP_TIMEOUT_SECONDS = max(5, min(120, GOOGLE_HTTP_TIMEOUT_SECONDS))
 try:
     CALENDAR_RETRY_BACKOFF_MINUTES = int(os.environ.get('CALENDAR_RETRY_BACKOFF_MINUTES', '60'))
 except ValueError:
@@ -102,25 +140,106 @@ CALENDAR_API_SETUP_URL = 'https://console.cloud.google.com/apis/library/calendar
 
 EXCLUDED_MEMBER_HEADERS = {'date', 'event', 'amount', 'notes', 'venue'}
 
-AVAILABILITY_PARSE_PROMPT = """You parse natural language availability statements into JSON.
+AVAILABILITY_PARSE_PROMPT = """You parse natural language availability statements.
 Today's date is {today}.
 
 Extract:
 1) dates: array of all dates mentioned in YYYY-MM-DD format.
 2) status: "available" or "unavailable".
 
+Rules:
+- Resolve relative dates from today's date."""
+
+AVAILABILITY_BATCH_PARSE_PROMPT = """You parse several natural language availability statements.
+Today's date is {today}.
+
+The user message is a JSON array of objects with "index" and "text".
+For each statement extract:
+1) index: the statement's "index" value.
+2) dates: array of all dates mentioned in YYYY-MM-DD format.
+3) status: "available" or "unavailable".
+
 Rules:
 - Resolve relative dates from today's date.
-- Return only strict JSON object: {{"dates": [...], "status": "available|unavailable"}}.
-- Do not include explanation or markdown."""
+- Return exactly one item per statement, in the same order."""
+AVAILABILITY_BATCH_LIMIT = 20
+
+# Statements like "available 2025-05-12" or "can't do 2025-06-01, 2025-06-02"
+# are parsed locally; anything with relative dates, ranges or extra wording
+# still goes to OpenAI.
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+FAST_PATH_AVAILABILITY_RE = re.compile(
+    r"""^\s*(?:i'?m\s+|i\s+am\s+)?
+    (?P<phrase>unavailable|not\s+available|can'?t\s+do|cannot\s+do|can\s+not\s+do|busy
+        |available|free|can\s+do)
+    \s*(?:\bon\s+)?:?\s*
+    (?P<dates>\d{4}-\d{2}-\d{2}(?:\s*(?:,\s*(?:and\s+)?|&|\band\s+)\s*\d{4}-\d{2}-\d{2})*)
+    \s*[.!]?\s*$""",
+    re.IGNORECASE | re.VERBOSE | re.ASCII
+)
+FAST_PATH_AVAILABLE_PHRASES = {'available', 'free', 'can do'}
+
+_AVAILABILITY_ITEM_PROPERTIES: Dict[str, Any] = {
+    "dates": {"type": "array", "items": {"type": "string"}},
+    "status": {"type": "string", "enum": ["available", "unavailable"]},
+}
+# OpenAI structured outputs: the model is constrained to these schemas.
+AVAILABILITY_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "availability_update",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": _AVAILABILITY_ITEM_PROPERTIES,
+            "required": ["dates", "status"],
+            "additionalProperties": False,
+        },
+    },
+}
+AVAILABILITY_BATCH_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "availability_update_batch",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "index": {"type": "integer"},
+                            **_AVAILABILITY_ITEM_PROPERTIES,
+                        },
+                        "required": ["index", "dates", "status"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["items"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 _openai_client: Optional[OpenAI] = None
+_openai_client_lock = Lock()
 _calendar_retry_after: Optional[datetime] = None
 _calendar_unavailable_reason: Optional[str] = None
 _sheet_name_cache_value: Optional[str] = None
 _sheet_name_cache_expiry: Optional[datetime] = None
 _sheet_name_cache_lock = Lock()
+_sheet_read_cache: Dict[Tuple[Any, ...], Tuple[datetime, Dict[str, Any]]] = {}
+_sheet_read_cache_lock = Lock()
 _request_counter = 0
+# httplib2.Http is not thread-safe, so each worker thread keeps its own.
+_google_http_local = local()
+_availability_parse_executor = ThreadPoolExecutor(
+    max_workers=AVAILABILITY_PARSE_WORKERS,
+    thread_name_prefix='availability-parse'
+)
 _request_counter_lock = Lock()
 
 
@@ -133,11 +252,12 @@ class AvailabilityUpdate:
 def get_openai_client() -> OpenAI:
     """Lazily initialize OpenAI client to keep startup memory lower"""
     global _openai_client
-    if _openai_client is None:
-        if not OPENAI_API_KEY:
-            raise Exception("OPENAI_API_KEY environment variable is not set")
-        _openai_client = OpenAI(api_key=OPENAI_API_KEY)
-    return _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            if not OPENAI_API_KEY:
+                raise Exception("OPENAI_API_KEY environment variable is not set")
+            _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+        return _openai_client
 
 
 def normalize_availability_payload(payload: Dict[str, Any]) -> AvailabilityUpdate:
@@ -179,7 +299,7 @@ def reset_calendar_backoff():
 
 def get_oauth_client_config() -> Dict[str, Any]:
     """Return the installed/web OAuth client section from CLIENT_CONFIG."""
-    return CLIENT_CONFIG.get('web') or CLIENT_CONFIG.get('installed') or {}
+    return OAUTH_CLIENT_CONFIG
 
 
 def enrich_credentials_dict(stored: Dict[str, Any]) -> Dict[str, Any]:
@@ -196,8 +316,12 @@ def enrich_credentials_dict(stored: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def credentials_to_session_dict(credentials: Credentials) -> Dict[str, Any]:
-    """Serialize Google credentials for Flask session storage"""
-    return enrich_credentials_dict({
+    """Serialize Google credentials for Flask session storage.
+
+    Fields that match CLIENT_CONFIG are left out of the cookie and restored by
+    enrich_credentials_dict, so every request carries only the user's tokens.
+    """
+    enriched = enrich_credentials_dict({
         'token': credentials.token,
         'refresh_token': credentials.refresh_token,
         'token_uri': credentials.token_uri,
@@ -205,6 +329,12 @@ def credentials_to_session_dict(credentials: Credentials) -> Dict[str, Any]:
         'client_secret': credentials.client_secret,
         'scopes': normalize_granted_scopes(list(credentials.scopes or []))
     })
+    client_defaults = enrich_credentials_dict({})
+    return {
+        key: value
+        for key, value in enriched.items()
+        if key in SESSION_CREDENTIAL_KEYS or value != client_defaults[key]
+    }
 
 
 def credentials_from_session() -> Optional[Credentials]:
@@ -224,7 +354,7 @@ def get_refreshed_credentials() -> Optional[Credentials]:
 
     if not credentials.valid:
         if not credentials.refresh_token:
-            print("Session credentials expired without refresh_token; re-auth required")
+            log.warning("Session credentials expired without refresh_token; re-auth required")
             session.clear()
             return None
 
@@ -234,7 +364,7 @@ def get_refreshed_credentials() -> Optional[Credentials]:
             credentials.client_secret,
         )
         if not all(required_fields):
-            print("Session credentials missing OAuth client fields; re-auth required")
+            log.warning("Session credentials missing OAuth client fields; re-auth required")
             session.clear()
             return None
 
@@ -242,7 +372,7 @@ def get_refreshed_credentials() -> Optional[Credentials]:
             credentials.refresh(Request())
             session['credentials'] = credentials_to_session_dict(credentials)
         except Exception as refresh_error:
-            print(f"Token refresh failed: {refresh_error}")
+            log.warning("Token refresh failed: %s", refresh_error)
             session.clear()
             return None
 
@@ -345,6 +475,7 @@ def find_member_column_index(headers: List[str], member_name: str) -> int:
     raise ValueError(member_name)
 
 
+@lru_cache(maxsize=None)
 def column_index_to_letter(index: int) -> str:
     """Convert a 0-based column index into Google Sheets column letters."""
     if index < 0:
@@ -358,13 +489,46 @@ def column_index_to_letter(index: int) -> str:
     return ''.join(reversed(letters))
 
 
+def get_pooled_http() -> httplib2.Http:
+    """Return this thread's keep-alive HTTP transport for Google API calls."""
+    http = getattr(_google_http_local, 'http', None)
+    if http is None:
+        http = httplib2.Http(timeout=GOOGLE_HTTP_TIMEOUT_SECONDS)
+        _google_http_local.http = http
+    return http
+
+
+def get_google_service(api_name: str, api_version: str, credentials: Credentials):
+    """Return this thread's built API client, bound to the request credentials.
+
+    build() regenerates every resource method (and its schema docstrings) for
+    each new client, so the client is built once per thread and only its
+    credentials are swapped between requests.
+    """
+    services = getattr(_google_http_local, 'services', None)
+    if services is None:
+        services = {}
+        _google_http_local.services = services
+
+    cached = services.get((api_name, api_version))
+    if cached is None:
+        authorized_http = AuthorizedHttp(credentials, http=get_pooled_http())
+        service = build(api_name, api_version, http=authorized_http, cache_discovery=False)
+        services[(api_name, api_version)] = (service, authorized_http)
+        return service
+
+    service, authorized_http = cached
+    authorized_http.credentials = credentials
+    return service
+
+
 def get_sheets_service():
     """Get authenticated Google Sheets service"""
     credentials = get_refreshed_credentials()
     if not credentials:
         return None
 
-    return build('sheets', 'v4', credentials=credentials, cache_discovery=False)
+    return get_google_service('sheets', 'v4', credentials)
 
 
 def get_calendar_service():
@@ -373,7 +537,7 @@ def get_calendar_service():
     if not credentials:
         return None
 
-    return build('calendar', 'v3', credentials=credentials, cache_discovery=False)
+    return get_google_service('calendar', 'v3', credentials)
 
 
 def get_primary_sheet_name(service) -> str:
@@ -388,7 +552,10 @@ def get_primary_sheet_name(service) -> str:
         ):
             return _sheet_name_cache_value
 
-    sheet_metadata = service.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
+    sheet_metadata = service.spreadsheets().get(
+        spreadsheetId=SPREADSHEET_ID,
+        fields='sheets.properties.title'
+    ).execute()
     sheets = sheet_metadata.get('sheets', [])
     if not sheets:
         raise Exception("No sheets found in spreadsheet")
@@ -428,7 +595,9 @@ def get_sheet_values(service, sheet_name: str, range_suffix: str) -> List[List[s
     """Read a range from the active sheet and return row values."""
     result = service.spreadsheets().values().get(
         spreadsheetId=SPREADSHEET_ID,
-        range=f'{sheet_name}!{range_suffix}'
+        range=f'{sheet_name}!{range_suffix}',
+        majorDimension='ROWS',
+        fields='values'
     ).execute()
     return result.get('values', [])
 
@@ -442,13 +611,33 @@ def get_sheet_values_for_window(
 ) -> List[List[str]]:
     """Read only enough rows for windowed schedule rendering."""
     row_limit = max(250, min(5000, lookback_days + lookahead_days + max_rows + 40))
-    return get_sheet_values(service, sheet_name, f"A1:Z{row_limit}")
+    return get_sheet_values(service, sheet_name, f"1:{row_limit}")
 
 
-def get_sheet_values_for_update(service, sheet_name: str, requested_dates: List[str]) -> List[List[str]]:
-    """Read only enough rows to satisfy update operations."""
-    row_limit = max(250, min(SHEET_ROW_SCAN_LIMIT, len(requested_dates) + 80))
-    return get_sheet_values(service, sheet_name, f"A1:Z{row_limit}")
+def get_sheet_ranges(service, sheet_name: str, range_suffixes: List[str]) -> List[List[List[str]]]:
+    """Read several ranges from the active sheet in one request."""
+    result = service.spreadsheets().values().batchGet(
+        spreadsheetId=SPREADSHEET_ID,
+        ranges=[f'{sheet_name}!{range_suffix}' for range_suffix in range_suffixes],
+        majorDimension='ROWS',
+        fields='valueRanges(values)'
+    ).execute()
+    value_ranges = result.get('valueRanges', [])
+    return [
+        value_ranges[index].get('values', []) if index < len(value_ranges) else []
+        for index in range(len(range_suffixes))
+    ]
+
+
+def get_sheet_values_for_update(service, sheet_name: str) -> Tuple[List[str], List[List[str]]]:
+    """Read only the header row and date column needed to address update cells."""
+    header_rows, date_rows = get_sheet_ranges(
+        service,
+        sheet_name,
+        [HEADER_ROW_RANGE, f"A2:A{SHEET_ROW_SCAN_LIMIT}"]
+    )
+    headers = header_rows[0] if header_rows else []
+    return headers, date_rows
 
 
 def get_sheet_values_for_event_summary(service, sheet_name: str) -> List[List[str]]:
@@ -456,12 +645,57 @@ def get_sheet_values_for_event_summary(service, sheet_name: str) -> List[List[st
     return get_sheet_values(service, sheet_name, KEY_EVENTS_SHEET_RANGE)
 
 
-def clear_sheet_name_cache():
-    """Invalidate cached sheet metadata after structural updates."""
-    global _sheet_name_cache_value, _sheet_name_cache_expiry
-    with _sheet_name_cache_lock:
-        _sheet_name_cache_value = None
-        _sheet_name_cache_expiry = None
+def sheet_read_cache_key(endpoint: str, *params: Any) -> Tuple[Any, ...]:
+    """Key cached reads by endpoint, parameters and the caller's access token."""
+    token = (session.get('credentials') or {}).get('token') or ''
+    token_digest = hashlib.sha256(token.encode('utf-8')).hexdigest()
+    return (endpoint, token_digest) + params
+
+
+def get_cached_sheet_read(key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    """Return a cached read payload if it is still fresh."""
+    if SHEET_READ_CACHE_SECONDS <= 0:
+        return None
+
+    now = datetime.now(timezone.utc)
+    with _sheet_read_cache_lock:
+        cached = _sheet_read_cache.get(key)
+        if not cached:
+            return None
+        expiry, payload = cached
+        if now >= expiry:
+            _sheet_read_cache.pop(key, None)
+            return None
+        return payload
+
+
+def store_cached_sheet_read(key: Tuple[Any, ...], payload: Dict[str, Any]):
+    """Cache a read payload for SHEET_READ_CACHE_SECONDS."""
+    if SHEET_READ_CACHE_SECONDS <= 0:
+        return
+
+    now = datetime.now(timezone.utc)
+    with _sheet_read_cache_lock:
+        if len(_sheet_read_cache) >= SHEET_READ_CACHE_MAX_ENTRIES:
+            for stale_key in [k for k, (expiry, _) in _sheet_read_cache.items() if now >= expiry]:
+                _sheet_read_cache.pop(stale_key, None)
+            while len(_sheet_read_cache) >= SHEET_READ_CACHE_MAX_ENTRIES:
+                _sheet_read_cache.pop(next(iter(_sheet_read_cache)))
+        _sheet_read_cache[key] = (now + timedelta(seconds=SHEET_READ_CACHE_SECONDS), payload)
+
+
+def clear_sheet_read_cache():
+    """Drop cached reads after the sheet has been written."""
+    with _sheet_read_cache_lock:
+        _sheet_read_cache.clear()
+
+
+def conditional_json(payload: Dict[str, Any]):
+    """JSON response with an ETag, answering 304 when the client copy matches."""
+    response = jsonify(payload)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 def to_int(value: Optional[str], default: int, min_value: int = 1, max_value: int = 500) -> int:
@@ -473,12 +707,18 @@ def to_int(value: Optional[str], default: int, min_value: int = 1, max_value: in
     return max(min_value, min(parsed, max_value))
 
 
+@lru_cache(maxsize=4096)
 def parse_sheet_date(raw_value: str) -> Optional[datetime.date]:
     """Parse date strings from spreadsheet rows"""
     if not raw_value:
         return None
     
     value = raw_value.strip()
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%m/%d/%Y", "%b %d %Y", "%d %b %Y"):
         try:
             return datetime.strptime(value, fmt).date()
@@ -983,18 +1223,28 @@ def sync_sheet_events_to_calendar(
     }
 
 
-def parse_availability(availability_text: str) -> AvailabilityUpdate:
-    """Use OpenAI JSON mode to parse natural language availability"""
+@lru_cache(maxsize=8)
+def availability_system_message(prompt_template: str, today: str) -> Dict[str, str]:
+    """Format a parser system prompt once per day instead of per request"""
+    return {"role": "system", "content": prompt_template.format(today=today)}
+
+
+def request_availability_json(
+    prompt_template: str,
+    user_content: str,
+    response_format: Dict[str, Any]
+) -> Any:
+    """Send one availability prompt with a structured-output schema and decode the reply"""
     today = datetime.now().strftime("%Y-%m-%d")
     client = get_openai_client()
 
     completion = client.chat.completions.create(
         model=OPENAI_MODEL,
         temperature=0,
-        response_format={"type": "json_object"},
+        response_format=response_format,
         messages=[
-            {"role": "system", "content": AVAILABILITY_PARSE_PROMPT.format(today=today)},
-            {"role": "user", "content": availability_text}
+            availability_system_message(prompt_template, today),
+            {"role": "user", "content": user_content}
         ]
     )
 
@@ -1003,31 +1253,123 @@ def parse_availability(availability_text: str) -> AvailabilityUpdate:
         raise Exception("Availability parser returned an empty response")
 
     try:
-        payload = json.loads(content)
+        return json.loads(content)
     except json.JSONDecodeError as json_error:
         raise Exception("Availability parser returned invalid JSON") from json_error
 
+
+def parse_availability_fast_path(availability_text: str) -> Optional[AvailabilityUpdate]:
+    """Parse plain "<keyword> <ISO dates>" statements without calling OpenAI"""
+    match = FAST_PATH_AVAILABILITY_RE.match(availability_text.replace('\u2019', "'"))
+    if not match:
+        return None
+
+    phrase = ' '.join(match.group('phrase').lower().split())
+    status = 'available' if phrase in FAST_PATH_AVAILABLE_PHRASES else 'unavailable'
+    raw_dates = ISO_DATE_RE.findall(match.group('dates'))
+    try:
+        parsed = normalize_availability_payload({'dates': raw_dates, 'status': status})
+    except ValueError:
+        return None
+
+    # normalize_availability_payload drops invalid dates; let OpenAI handle those
+    if len(parsed.dates) != len(set(raw_dates)):
+        return None
+    return parsed
+
+
+def parse_availability(availability_text: str) -> AvailabilityUpdate:
+    """Use OpenAI structured outputs to parse natural language availability"""
+    fast_parsed = parse_availability_fast_path(availability_text)
+    if fast_parsed:
+        return fast_parsed
+
+    payload = request_availability_json(
+        AVAILABILITY_PARSE_PROMPT,
+        availability_text,
+        AVAILABILITY_RESPONSE_FORMAT
+    )
     return normalize_availability_payload(payload)
 
 
-def update_google_sheet(member_name: str, dates: List[str], status: str):
-    """Update Google Sheet with availability"""
-    service = get_sheets_service()
-    if not service:
-        raise Exception("Not authenticated with Google")
-    
-    # Get sheet name dynamically
-    sheet_name = get_primary_sheet_name(service)
-    print(f"Updating sheet: {sheet_name}")
-    
-    # Get current sheet data (bounded range for memory control)
-    values = get_sheet_values(service, sheet_name, "A1:Z1000")
-    
-    if not values:
-        raise Exception("Sheet is empty")
-    
-    # Find member column
-    headers = values[0]
+def parse_availability_batch(availability_texts: List[str]) -> List[Tuple[Optional[AvailabilityUpdate], Optional[str]]]:
+    """Parse several availability statements with at most one OpenAI request"""
+    results: List[Tuple[Optional[AvailabilityUpdate], Optional[str]]] = []
+    pending_positions: List[int] = []
+    for position, text in enumerate(availability_texts):
+        fast_parsed = parse_availability_fast_path(text)
+        results.append((fast_parsed, None))
+        if not fast_parsed:
+            pending_positions.append(position)
+
+    if not pending_positions:
+        return results
+
+    # A JSON array keeps multi-line statements from being read as extra items.
+    indexed_texts = json.dumps([
+        {"index": index, "text": availability_texts[position].strip()}
+        for index, position in enumerate(pending_positions, start=1)
+    ], ensure_ascii=False)
+    payload = request_availability_json(
+        AVAILABILITY_BATCH_PARSE_PROMPT,
+        indexed_texts,
+        AVAILABILITY_BATCH_RESPONSE_FORMAT
+    )
+
+    items_by_index: Dict[int, Dict[str, Any]] = {}
+    raw_items = payload.get("items", []) if isinstance(payload, dict) else []
+    for item in raw_items if isinstance(raw_items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            items_by_index[int(item.get("index"))] = item
+        except (TypeError, ValueError):
+            continue
+
+    for index, position in enumerate(pending_positions, start=1):
+        item = items_by_index.get(index)
+        if item is None:
+            results[position] = (None, "Availability parser skipped this statement")
+            continue
+        try:
+            results[position] = (normalize_availability_payload(item), None)
+        except ValueError as parse_error:
+            results[position] = (None, str(parse_error))
+
+    return results
+
+
+def build_column_run_updates(
+    sheet_name: str,
+    col_letter: str,
+    row_indexes: List[int],
+    mark: str
+) -> List[Dict[str, Any]]:
+    """Coalesce rows in one column into a single range per contiguous run"""
+    updates: List[Dict[str, Any]] = []
+    sorted_rows = sorted(set(row_indexes))
+    for _, run in groupby(enumerate(sorted_rows), key=lambda item: item[1] - item[0]):
+        run_rows = [row_index for _, row_index in run]
+        first_row, last_row = run_rows[0], run_rows[-1]
+        cell_range = f"{col_letter}{first_row}"
+        if last_row != first_row:
+            cell_range += f":{col_letter}{last_row}"
+        updates.append({
+            'range': f'{sheet_name}!{cell_range}',
+            'values': [[mark] for _ in run_rows]
+        })
+    return updates
+
+
+def plan_member_updates(
+    sheet_name: str,
+    headers: List[str],
+    date_row_index: Dict[str, int],
+    member_name: str,
+    dates: List[str],
+    status: str
+) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+    """Work out the range writes for one member without touching the sheet"""
     try:
         member_col_index = find_member_column_index(headers, member_name)
     except ValueError:
@@ -1036,36 +1378,115 @@ def update_google_sheet(member_name: str, dates: List[str], status: str):
             f"Available: {', '.join(filter_member_headers(headers))}"
         )
     
-    # Update dates
-    updates = []
+    matched_rows = []
     dates_not_found = []
     
     for date in dates:
-        found = False
-        for row_index, row in enumerate(values[1:], start=2):
-            if len(row) > 0 and row[0] == date:
-                col_letter = column_index_to_letter(member_col_index)
-                cell = f"{col_letter}{row_index}"
-                
-                updates.append({
-                    'range': f'{sheet_name}!{cell}',
-                    'values': [['✓' if status == 'available' else '✗']]
-                })
-                found = True
-                break
-        
-        if not found:
+        row_index = date_row_index.get(date)
+        if row_index is None:
             dates_not_found.append(date)
+        else:
+            matched_rows.append(row_index)
+    
+    updates = build_column_run_updates(
+        sheet_name,
+        column_index_to_letter(member_col_index),
+        matched_rows,
+        '✓' if status == 'available' else '✗'
+    )
+    return updates, len(matched_rows), dates_not_found
+
+
+def build_date_row_index(date_rows: List[List[str]]) -> Dict[str, int]:
+    """Map each date in column A to its 1-based sheet row, keeping the first match"""
+    date_row_index: Dict[str, int] = {}
+    for row_index, row in enumerate(date_rows, start=2):
+        if row:
+            date_row_index.setdefault(row[0], row_index)
+    return date_row_index
+
+
+def load_update_context(service) -> Tuple[str, List[str], Dict[str, int]]:
+    """Resolve the sheet name, header row and date→row index for updates"""
+    sheet_name = get_primary_sheet_name(service)
+    log.debug("Updating sheet: %s", sheet_name)
+    
+    # Get header row and date column only (bounded range for memory control)
+    headers, date_rows = get_sheet_values_for_update(service, sheet_name)
+    
+    if not headers:
+        raise Exception("Sheet is empty")
+    
+    return sheet_name, headers, build_date_row_index(date_rows)
+
+
+def apply_sheet_updates(service, updates: List[Dict[str, Any]]):
+    """Write all planned ranges in a single batchUpdate"""
+    if not updates:
+        return
+    
+    body = {'data': updates, 'valueInputOption': 'RAW'}
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=SPREADSHEET_ID,
+        body=body
+    ).execute()
+    clear_sheet_read_cache()
+
+
+def update_google_sheet(
+    member_name: str,
+    dates: List[str],
+    status: str,
+    service=None,
+    context: Optional[Tuple[str, List[str], Dict[str, int]]] = None
+):
+    """Update Google Sheet with availability"""
+    if service is None:
+        service = get_sheets_service()
+    if not service:
+        raise Exception("Not authenticated with Google")
     
-    if updates:
-        body = {'data': updates, 'valueInputOption': 'RAW'}
-        service.spreadsheets().values().batchUpdate(
-            spreadsheetId=SPREADSHEET_ID,
-            body=body
-        ).execute()
-        clear_sheet_name_cache()
+    sheet_name, headers, date_row_index = context or load_update_context(service)
+    updates, updated_count, dates_not_found = plan_member_updates(
+        sheet_name, headers, date_row_index, member_name, dates, status
+    )
+    apply_sheet_updates(service, updates)
+    
+    return updated_count, dates_not_found
+
+
+def update_google_sheet_batch(
+    entries: List[Tuple[str, AvailabilityUpdate]],
+    service=None,
+    context: Optional[Tuple[str, List[str], Dict[str, int]]] = None
+) -> List[Dict[str, Any]]:
+    """Update several members' availability with one read and one write"""
+    if service is None:
+        service = get_sheets_service()
+    if not service:
+        raise Exception("Not authenticated with Google")
+    
+    sheet_name, headers, date_row_index = context or load_update_context(service)
+    
+    all_updates: List[Dict[str, Any]] = []
+    results: List[Dict[str, Any]] = []
+    for member_name, parsed in entries:
+        try:
+            updates, updated_count, dates_not_found = plan_member_updates(
+                sheet_name, headers, date_row_index, member_name, parsed.dates, parsed.status
+            )
+        except Exception as plan_error:
+            results.append({'error': str(plan_error)})
+            continue
+        
+        all_updates.extend(updates)
+        results.append({
+            'updated_count': updated_count,
+            'dates_not_found': dates_not_found
+        })
     
-    return len(updates), dates_not_found
+    apply_sheet_updates(service, all_updates)
+    return results
 
 
 @app.route('/')
@@ -1120,7 +1541,7 @@ def login_error():
 @app.route('/authorize')
 def authorize():
     """Start OAuth flow"""
-    print("=== STARTING OAUTH FLOW ===")
+    log.debug("Starting OAuth flow")
     clear_oauth_session()
     flow = build_oauth_flow()
 
@@ -1132,8 +1553,8 @@ def authorize():
 
     authorization_url, state = flow.authorization_url(**auth_kwargs)
 
-    print(f"Redirect URI: {url_for('oauth2callback', _external=True)}")
-    print(f"Authorization URL: {authorization_url}")
+    log.debug("OAuth redirect URI: %s", flow.redirect_uri)
+    log.debug("OAuth authorization URL: %s", authorization_url)
 
     store_oauth_flow_state(state)
     return redirect(authorization_url)
@@ -1145,16 +1566,14 @@ def oauth2callback():
     if request.method == 'HEAD':
         return '', 200
 
-    print("=== OAUTH CALLBACK RECEIVED ===")
-    print(f"Request method: {request.method}")
-    print(f"Request URL: {request.url}")
-    print(f"Session state: {session.get('oauth_state', session.get('state', 'NOT FOUND'))}")
+    log.debug("OAuth callback received: %s %s", request.method, request.url)
+    log.debug("OAuth session state: %s", session.get('oauth_state', session.get('state', 'NOT FOUND')))
 
     try:
         oauth_error = request.args.get('error')
         if oauth_error:
-            print(
-                "OAuth denied:",
+            log.info(
+                "OAuth denied: %s %s",
                 oauth_error,
                 request.args.get('error_description', '')
             )
@@ -1163,7 +1582,7 @@ def oauth2callback():
             )
 
         if not request.args.get('code'):
-            print("OAuth callback missing authorization code")
+            log.warning("OAuth callback missing authorization code")
             return oauth_failed(
                 'Google sign-in did not return an authorization code. Please try again.'
             )
@@ -1172,13 +1591,13 @@ def oauth2callback():
         callback_state = request.args.get('state')
 
         if not state:
-            print("OAuth callback missing session state")
+            log.warning("OAuth callback missing session state")
             return oauth_failed(
                 'Your sign-in session expired before Google redirected back. Please try again.'
             )
 
         if callback_state != state:
-            print(f"OAuth state mismatch: session={state}, callback={callback_state}")
+            log.warning("OAuth state mismatch: session=%s, callback=%s", state, callback_state)
             return oauth_failed(
                 'Google sign-in could not be verified. Please try again.'
             )
@@ -1191,7 +1610,7 @@ def oauth2callback():
 
         credentials = flow.credentials
         if not credentials or not credentials.token:
-            print("OAuth callback returned no credentials")
+            log.warning("OAuth callback returned no credentials")
             return oauth_failed(
                 'Google sign-in completed without credentials. Please try again.'
             )
@@ -1202,7 +1621,7 @@ def oauth2callback():
             stored_credentials['refresh_token'] = existing_credentials['refresh_token']
 
         if not stored_credentials.get('refresh_token'):
-            print("OAuth callback returned no refresh_token")
+            log.warning("OAuth callback returned no refresh_token")
             return oauth_failed(
                 'Google did not return a refresh token. Remove this app from your Google Account '
                 'permissions, then sign in again using Sign in again.'
@@ -1213,20 +1632,17 @@ def oauth2callback():
         clear_oauth_session()
         session.pop('auth_error', None)
         reset_calendar_backoff()
-        print("OAuth credentials stored in session")
-        print(f"Credentials: token={credentials.token[:20]}...")
+        log.info("OAuth credentials stored in session")
 
         return redirect(url_for('index'))
     except (InvalidGrantError, OAuth2Error, Warning) as oauth_exception:
-        print(f"OAuth token exchange failed: {oauth_exception}")
+        log.warning("OAuth token exchange failed: %s", oauth_exception)
         return oauth_failed(
             'Google could not complete sign-in. Please use Sign in again below. '
             'If this keeps happening, remove Band Availability from your Google Account permissions and retry.'
         )
     except Exception as oauth_exception:
-        print(f"OAuth callback failed: {oauth_exception}")
-        import traceback
-        traceback.print_exc()
+        log.exception("OAuth callback failed: %s", oauth_exception)
         return oauth_failed(
             'Something went wrong during Google sign-in. Please try again.'
         )
@@ -1245,34 +1661,35 @@ def logout():
 def get_members():
     """Get list of band members from sheet"""
     try:
-        print("=== GET MEMBERS REQUEST ===")
-        print(f"Session credentials present: {'credentials' in session}")
-        
         service = get_sheets_service()
         if not service:
-            print("ERROR: Not authenticated")
             return jsonify({'error': 'Not authenticated'}), 401
         
-        print(f"Fetching from spreadsheet: {SPREADSHEET_ID}")
+        cache_key = sheet_read_cache_key('members')
+        cached_payload = get_cached_sheet_read(cache_key)
+        if cached_payload is not None:
+            return conditional_json(cached_payload)
+        
+        log.debug("Fetching members from spreadsheet: %s", SPREADSHEET_ID)
         
         # First, get the sheet metadata to find the actual sheet name
         sheet_name = get_primary_sheet_name(service)
-        print(f"Using sheet: {sheet_name}")
+        log.debug("Using sheet: %s", sheet_name)
         
         # Fetch only header row
-        values = get_sheet_values(service, sheet_name, "A1:Z1")
+        values = get_sheet_values(service, sheet_name, HEADER_ROW_RANGE)
         headers = values[0] if values else []
-        print(f"Headers found: {headers}")
+        log.debug("Headers found: %s", headers)
         
         members = filter_member_headers(headers) if len(headers) > 1 else []
-        print(f"Members extracted: {members}")
+        log.debug("Members extracted: %s", members)
         
-        return jsonify({'members': members})
+        payload = {'members': members}
+        store_cached_sheet_read(cache_key, payload)
+        return conditional_json(payload)
     
     except Exception as e:
-        print(f"ERROR in get_members: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in get_members: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1290,14 +1707,22 @@ def update_availability():
         if 'credentials' not in session:
             return jsonify({'error': 'Not authenticated'}), 401
         
-        # Parse availability text with OpenAI
-        parsed = parse_availability(availability_text)
+        service = get_sheets_service()
+        if not service:
+            return jsonify({'error': 'Not authenticated'}), 401
+        
+        # Parse availability text with OpenAI while the sheet layout loads
+        parse_future = _availability_parse_executor.submit(parse_availability, availability_text)
+        context = load_update_context(service)
+        parsed = parse_future.result()
         
         # Update sheet
         updated_count, dates_not_found = update_google_sheet(
             member_name=member_name,
             dates=parsed.dates,
-            status=parsed.status
+            status=parsed.status,
+            service=service,
+            context=context
         )
         
         message = f'Updated {updated_count} date(s) successfully'
@@ -1313,9 +1738,79 @@ def update_availability():
         })
     
     except Exception as e:
-        print(f"Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in update_availability: %s", e)
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/update-availability-batch', methods=['POST'])
+def update_availability_batch():
+    """Update availability for several members with one parse and one sheet write"""
+    try:
+        data = request.json or {}
+        items = data.get('items')
+        
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'Missing items'}), 400
+        
+        if len(items) > AVAILABILITY_BATCH_LIMIT:
+            return jsonify({'error': f'At most {AVAILABILITY_BATCH_LIMIT} items per request'}), 400
+        
+        for item in items:
+            if (
+                not isinstance(item, dict)
+                or not isinstance(item.get('memberName'), str)
+                or not isinstance(item.get('availabilityText'), str)
+                or not item['memberName'].strip()
+                or not item['availabilityText'].strip()
+            ):
+                return jsonify({'error': 'Each item needs memberName and availabilityText'}), 400
+        
+        if 'credentials' not in session:
+            return jsonify({'error': 'Not authenticated'}), 401
+        
+        service = get_sheets_service()
+        if not service:
+            return jsonify({'error': 'Not authenticated'}), 401
+        
+        parse_future = _availability_parse_executor.submit(
+            parse_availability_batch,
+            [item['availabilityText'] for item in items]
+        )
+        context = load_update_context(service)
+        parsed_items = parse_future.result()
+        
+        results: List[Dict[str, Any]] = [{'memberName': item['memberName']} for item in items]
+        entries: List[Tuple[str, AvailabilityUpdate]] = []
+        entry_positions: List[int] = []
+        for position, (parsed, parse_error) in enumerate(parsed_items):
+            if parsed is None:
+                results[position]['error'] = parse_error
+                continue
+            results[position].update({'dates': parsed.dates, 'status': parsed.status})
+            entries.append((items[position]['memberName'], parsed))
+            entry_positions.append(position)
+        
+        if entries:
+            sheet_results = update_google_sheet_batch(entries, service=service, context=context)
+            for position, sheet_result in zip(entry_positions, sheet_results):
+                results[position].update(sheet_result)
+        
+        updated_count = sum(result.get('updated_count', 0) for result in results)
+        error_count = sum(1 for result in results if result.get('error'))
+        
+        message = f'Updated {updated_count} date(s) across {len(results) - error_count} member update(s)'
+        if error_count:
+            message += f'. {error_count} update(s) failed'
+        
+        status_code = 200 if not error_count else 207
+        return jsonify({
+            'message': message,
+            'updated_count': updated_count,
+            'results': results
+        }), status_code
+    
+    except Exception as e:
+        log.exception("Error in update_availability_batch: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1323,7 +1818,6 @@ def update_availability():
 def view_schedule():
     """Get current schedule"""
     try:
-        print("=== VIEW SCHEDULE REQUEST ===")
         service = get_sheets_service()
         if not service:
             return jsonify({'error': 'Not authenticated'}), 401
@@ -1332,9 +1826,14 @@ def view_schedule():
         lookahead_days = to_int(request.args.get('lookaheadDays'), SCHEDULE_LOOKAHEAD_DAYS, 7, 365)
         max_rows = to_int(request.args.get('maxRows'), MAX_SCHEDULE_ROWS, 10, 500)
         
+        cache_key = sheet_read_cache_key('view-schedule', lookback_days, lookahead_days, max_rows)
+        cached_payload = get_cached_sheet_read(cache_key)
+        if cached_payload is not None:
+            return conditional_json(cached_payload)
+        
         # Get sheet name dynamically
         sheet_name = get_primary_sheet_name(service)
-        print(f"Fetching schedule from sheet: {sheet_name}")
+        log.debug("Fetching schedule from sheet: %s", sheet_name)
         
         raw_values = get_sheet_values_for_window(
             service,
@@ -1354,8 +1853,8 @@ def view_schedule():
             max_rows=max_rows
         )
         
-        print(f"Found {len(raw_values)} rows, returning {len(schedule) - 1} windowed rows")
-        return jsonify({
+        log.debug("Found %d rows, returning %d windowed rows", len(raw_values), len(schedule) - 1)
+        payload = {
             'schedule': schedule,
             'window': {
                 'lookback_days': lookback_days,
@@ -1364,12 +1863,12 @@ def view_schedule():
             },
             'rows_returned': max(0, len(schedule) - 1),
             'rows_total': max(0, len(raw_values) - 1)
-        })
+        }
+        store_cached_sheet_read(cache_key, payload)
+        return conditional_json(payload)
     
     except Exception as e:
-        print(f"ERROR in view_schedule: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in view_schedule: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1410,7 +1909,7 @@ def key_events():
                     )
                 except Exception as calendar_exception:
                     calendar_error = record_calendar_failure(calendar_exception)
-                    print(f"Calendar summary warning: {calendar_error}")
+                    log.warning("Calendar summary warning: %s", calendar_error)
         
         combined_events = combine_key_events(calendar_events, sheet_events)
         events = select_forward_looking_key_events(
@@ -1446,9 +1945,7 @@ def key_events():
         })
     
     except Exception as e:
-        print(f"ERROR in key_events: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in key_events: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
@@ -1541,22 +2038,20 @@ def sync_key_events_to_calendar():
         }), status_code
 
     except Exception as e:
-        print(f"ERROR in sync_key_events_to_calendar: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Error in sync_key_events_to_calendar: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
 if __name__ == '__main__':
     if not SPREADSHEET_ID:
-        print("WARNING: SPREADSHEET_ID environment variable not set!")
+        log.warning("SPREADSHEET_ID environment variable not set!")
     else:
-        print(f"Using spreadsheet: {SPREADSHEET_ID}")
+        log.info("Using spreadsheet: %s", SPREADSHEET_ID)
     
     if not OPENAI_API_KEY:
-        print("WARNING: OPENAI_API_KEY environment variable not set!")
+        log.warning("OPENAI_API_KEY environment variable not set!")
     else:
-        print("OpenAI API key loaded successfully")
+        log.info("OpenAI API key loaded successfully")
     
-    print("\n=== Starting Flask app on port 5001 ===\n")
+    log.info("Starting Flask app on port 5001")
     app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
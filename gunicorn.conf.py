@@ -3,7 +3,11 @@ import os
 # Keep memory bounded on Render free instances by recycling workers.
 # These settings are conservative and aim for stability over peak throughput.
 workers = int(os.getenv("WEB_CONCURRENCY", "1"))
-threads = int(os.getenv("GUNICORN_THREADS", "2"))
+
+# Requests mostly wait on Google and OpenAI, so extra threads are cheaper
+# than extra worker processes for handling concurrent users.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
 timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
 graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
 keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))